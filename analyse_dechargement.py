@@ -6,34 +6,55 @@ fichier Excel.
 Nouveautés :
 -----------
 * Les colonnes numériques suivantes sont **formatées dans Excel** avec
-  deux décimales et séparateur de milliers (« #,##0.00 ») :
+  deux décimales et séparateur de milliers (« #,##0.00 ») ; volume chargé
+  et poids eau sont arrondis à 2 décimales avant d'être réutilisés, les
+  poids nets sont enregistrés en pleine précision :
 
+    - Volume chargé (m³)
     - Poids eau Calculé (kg)
     - Poids net Calculé (kg)
     - Poids net Recalculé (kg)
 
+* Les durées (« Durée opération », « Temps traitement ») sont
+  exprimées en heures décimales, au format « 0.00 ».
 * Ajustement automatique de la largeur des colonnes (inchangé).
-* Export du résultat vers « Data_Analysis/YYYY‑MM‑DD/…_resultats.xlsx ».
+* Export du résultat vers « Data_Analysis/YYYY‑MM‑DD/…_resultats.xlsx »,
+  accompagné d'une copie « …_resultats.parquet » (si pyarrow est installé).
 
 Usage :
     python analyse_dechargement.py                # boîte de sélection
     python analyse_dechargement.py --input chemin/fichier.xlsx
+    python analyse_dechargement.py --input chemin/fichier.xlsx --no-excel
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from functools import cache
+from math import isfinite
+from typing import Callable, Final
+from xml.sax.saxutils import escape
 import os
+import re
 import sys
-import subprocess
 import argparse
-import tkinter as tk
-from tkinter import filedialog
+import zipfile
 
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
+
+try:  # lecteur xlsx en Rust, bien plus rapide qu'openpyxl (pandas >= 2.2)
+    import python_calamine  # noqa: F401
+except ImportError:
+    MOTEUR_LECTURE = "openpyxl"
+else:
+    MOTEUR_LECTURE = "calamine"
+
+try:  # stockage colonnaire Arrow et export Parquet
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 # ---------------------------------------------------------------------------
 # Noms de colonnes attendues dans le fichier source
@@ -61,12 +82,47 @@ COL_POIDS_EAU_CALCULE: str = "Poids eau Calculé (kg)"
 COL_POIDS_NET_CALCULE: str = "Poids net Calculé (kg)"  # basé sur poids eau mesuré
 COL_POIDS_NET_RECALCULE: str = "Poids net Recalculé (kg)"  # basé sur poids eau recalculé
 
-NUMERIC_COLUMNS_TO_FORMAT = [
+# Colonnes écrites (ou réécrites) par les calculs, dans l'ordre d'ajout
+COLONNES_CALCULEES: list[str] = [
+    COL_VOL_CHARGE_CALCULE,
     COL_POIDS_EAU_CALCULE,
+    COL_DUREE_OPERATION,
+    COL_TEMPS_TR,
     COL_POIDS_NET_CALCULE,
     COL_POIDS_NET_RECALCULE,
 ]
 
+# Coefficients de calcul (précalculés une fois pour toutes)
+WATER_COEF: Final[float] = 1.066  # 1 + 6,6 % : volume chargé → poids eau
+DRY_COEF: Final[float] = 0.93  # 1 - 7 % : abattement appliqué au poids net
+
+# Nombre de lignes à partir duquel le noyau Numba est préféré à NumPy.
+# Numba n'est importé qu'au-delà de ce seuil ; son import et son premier
+# appel, même avec le cache, coûtent ~0,45 s par exécution : il n'est rentable
+# que sur des feuilles proches de la limite Excel (1 048 576 lignes), dont la
+# lecture et l'écriture prennent de toute façon plusieurs secondes.
+SEUIL_NUMBA: int = 1_000_000
+
+# Les poids nets sont stockés en pleine précision ; seul le format Excel
+# limite leur affichage à deux décimales. Colonne → format numérique.
+NUMERIC_COLUMNS_TO_FORMAT: dict[str, str] = {
+    COL_VOL_CHARGE_CALCULE: "#,##0.00",  # 2 décimales + séparateur milliers
+    COL_POIDS_EAU_CALCULE: "#,##0.00",
+    COL_POIDS_NET_CALCULE: "#,##0.00",
+    COL_POIDS_NET_RECALCULE: "#,##0.00",
+    COL_DUREE_OPERATION: "0.00",  # durées en heures décimales
+    COL_TEMPS_TR: "0.00",
+}
+
+# Colonnes de mesure converties en float64 avant les calculs
+COLONNES_NUMERIQUES: list[str] = [
+    COL_VOL_INIT,
+    COL_VOL_FINAL,
+    COL_POIDS_ENTREE,
+    COL_POIDS_SORTIE,
+    COL_POIDS_EAU,
+]
+
 # Modèle minimal pour créer un fichier d'exemple
 COLONNES_MODELE: list[str] = [
     COL_DEBUT_PESEE,
@@ -81,46 +137,306 @@ COLONNES_MODELE: list[str] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Gabarits XML du classeur résultat (écriture directe, cf. ecrire_xlsx_direct)
+# ---------------------------------------------------------------------------
+TAILLE_BLOC: int = 10_000  # lignes rendues puis écrites à la fois
+
+EPOQUE_EXCEL = pd.Timestamp("1899-12-30")  # jour 0 des numéros de série Excel
+CARACTERES_INTERDITS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")  # hors XML 1.0
+
+STYLE_ENTETE: int = 1  # index dans <cellXfs> : en‑tête en gras
+STYLE_DATE: int = 2  # date et heure
+STYLE_DUREE: int = 3  # durée en heures cumulées
+STYLE_HEURE: int = 4  # heure seule ; les formats numériques suivent
+FORMAT_DATE: str = "yyyy-mm-dd h:mm:ss"
+FORMAT_DUREE: str = "[hh]:mm:ss"
+FORMAT_HEURE: str = "h:mm:ss"
+LARGEUR_DATE: int = len("2024-01-01 00:00:00")  # date affichée avec FORMAT_DATE
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+XML_CONTENT_TYPES = (
+    XML_DECLARATION
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+XML_RELS = (
+    XML_DECLARATION
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+XML_WORKBOOK = (
+    XML_DECLARATION
+    + f'<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}">'
+    '<sheets><sheet name="{nom}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+XML_WORKBOOK_RELS = (
+    XML_DECLARATION
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{NS_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{NS_REL}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+
 # ---------------------------------------------------------------------------
 # Fonctions utilitaires
 # ---------------------------------------------------------------------------
-def appliquer_format_numerique(wb_path: Path, header_row: int = 1) -> None:
-    """Applique un format numérique (#,##0.00) aux colonnes listées."""
-    wb = load_workbook(wb_path)
-    ws = wb.active
-
-    # Associer nom de colonne → index Excel
-    col_index = {cell.value: idx + 1 for idx, cell in enumerate(ws[header_row])}
-    num_format = "#,##0.00"  # 2 décimales + séparateur milliers
-
-    for col_name in NUMERIC_COLUMNS_TO_FORMAT:
-        idx = col_index.get(col_name)
-        if idx is None:
-            continue  # colonne absente
-        letter = get_column_letter(idx)
-        for row in range(header_row + 1, ws.max_row + 1):
-            ws[f"{letter}{row}"].number_format = num_format
-    wb.save(wb_path)
-
-def ajuster_largeur_colonnes(fichier_excel: Path) -> None:
-    """Ajuste la largeur des colonnes en fonction du contenu."""
-    wb = load_workbook(fichier_excel)
-    ws = wb.active
-    for col in ws.columns:
-        max_length = 0
-        col_letter = col[0].column_letter
-        for cell in col:
-            try:
-                valeur = str(cell.value) if cell.value is not None else ""
-            except Exception:
-                valeur = ""
-            max_length = max(max_length, len(valeur))
-        ws.column_dimensions[col_letter].width = max_length + 2
-    wb.save(fichier_excel)
+def lettre_colonne(numero: int) -> str:
+    """Lettre(s) Excel de la colonne *numero* (1 → « A », 27 → « AA »)."""
+    lettres = ""
+    while numero:
+        numero, reste = divmod(numero - 1, 26)
+        lettres = chr(ord("A") + reste) + lettres
+    return lettres
+
+
+def largeur_colonne(serie: pd.Series) -> int:
+    """Largeur d'affichage de *serie* : plus long contenu (en‑tête compris) + 2."""
+    if pd.api.types.is_datetime64_any_dtype(serie.dtype):
+        # astype(str) omet l'heure quand toutes les valeurs sont à minuit, or
+        # les cellules sont affichées avec l'heure (FORMAT_DATE)
+        longueur_max = LARGEUR_DATE if serie.notna().any() else 0
+    else:
+        # Conversion et mesure vectorisées plutôt qu'un str()/len() par cellule
+        longueur_max = serie.dropna().astype(str).str.len().max()
+    if pd.isna(longueur_max):  # colonne vide
+        longueur_max = 0
+    return max(len(str(serie.name)), int(longueur_max)) + 2
+
+
+def xml_styles(formats: list[str]) -> str:
+    """Construit ``xl/styles.xml`` : défaut, en‑tête gras, date, durée, heure, puis un style par format."""
+    num_fmts = [FORMAT_DATE, FORMAT_DUREE, FORMAT_HEURE, *formats]
+    fmts = "".join(
+        f'<numFmt numFmtId="{164 + i}" formatCode="{escape(code)}"/>' for i, code in enumerate(num_fmts)
+    )
+    xfs = "".join(
+        f'<xf numFmtId="{164 + i}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        for i in range(len(num_fmts))
+    )
+    return (
+        XML_DECLARATION
+        + f'<styleSheet xmlns="{NS_MAIN}">'
+        f'<numFmts count="{len(num_fmts)}">{fmts}</numFmts>'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{2 + len(num_fmts)}">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+        f"{xfs}</cellXfs>"
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    )
+
+
+def cellules_xml(serie: pd.Series, lettre: str, premiere_ligne: int, style: int) -> list[str]:
+    """Rend les cellules ``<c>`` de *serie* (une par ligne, ``""`` si vide).
+
+    La conversion est faite colonne par colonne selon le dtype : booléens et
+    entiers sont écrits tels quels, réels, dates et durées passent par un
+    tableau float64 (dates en numéro de série Excel, durées en jours) ;
+    seules les colonnes « object » sont traitées valeur
+    par valeur.
+    """
+    lignes = range(premiere_ligne, premiere_ligne + len(serie))
+    attr_style = f' s="{style}"' if style else ""
+
+    if pd.api.types.is_bool_dtype(serie.dtype):
+        return [
+            "" if pd.isna(v) else f'<c r="{lettre}{r}" t="b"{attr_style}><v>{int(v)}</v></c>'
+            for r, v in zip(lignes, serie.tolist())
+        ]
+    if pd.api.types.is_integer_dtype(serie.dtype):  # « 5 » et non « 5.0 »
+        return [
+            "" if pd.isna(v) else f'<c r="{lettre}{r}"{attr_style}><v>{int(v)}</v></c>'
+            for r, v in zip(lignes, serie.tolist())
+        ]
+    if pd.api.types.is_datetime64_any_dtype(serie.dtype):
+        if getattr(serie.dt, "tz", None) is not None:
+            serie = serie.dt.tz_localize(None)
+        serie = (serie - EPOQUE_EXCEL) / pd.Timedelta(days=1)
+        attr_style = f' s="{STYLE_DATE}"'
+    elif serie.dtype.kind == "m":  # timedelta64 (NumPy ou Arrow)
+        serie = serie / pd.Timedelta(days=1)
+        attr_style = f' s="{STYLE_DUREE}"'
+    elif not pd.api.types.is_numeric_dtype(serie.dtype):
+        return [valeur_xml(v, f"{lettre}{r}", attr_style) for r, v in zip(lignes, serie.tolist())]
+
+    valeurs = serie.to_numpy(dtype=np.float64, na_value=np.nan).tolist()
+    return [
+        f'<c r="{lettre}{r}"{attr_style}><v>{v!r}</v></c>' if isfinite(v) else ""
+        for r, v in zip(lignes, valeurs)
+    ]
+
+
+def valeur_xml(valeur: object, ref: str, attr_style: str = "") -> str:
+    """Rend une valeur isolée (colonne « object ») en cellule ``<c>``."""
+    if valeur is None or valeur is pd.NaT or valeur is pd.NA:
+        return ""
+    if isinstance(valeur, (bool, np.bool_)):
+        return f'<c r="{ref}" t="b"{attr_style}><v>{int(valeur)}</v></c>'
+    if isinstance(valeur, (int, np.integer)):
+        return f'<c r="{ref}"{attr_style}><v>{int(valeur)}</v></c>'
+    if isinstance(valeur, (float, np.number)):
+        valeur = float(valeur)
+        return f'<c r="{ref}"{attr_style}><v>{valeur!r}</v></c>' if isfinite(valeur) else ""
+    if isinstance(valeur, (datetime, date)):
+        serie = (pd.Timestamp(valeur) - EPOQUE_EXCEL) / pd.Timedelta(days=1)
+        return f'<c r="{ref}" s="{STYLE_DATE}"><v>{serie!r}</v></c>'
+    if isinstance(valeur, (timedelta, np.timedelta64)):
+        jours = pd.Timedelta(valeur) / pd.Timedelta(days=1)
+        return f'<c r="{ref}" s="{STYLE_DUREE}"><v>{jours!r}</v></c>'
+    if isinstance(valeur, time):  # heure seule : fraction de journée
+        fraction = (pd.Timedelta(hours=valeur.hour, minutes=valeur.minute, seconds=valeur.second,
+                                 microseconds=valeur.microsecond) / pd.Timedelta(days=1))
+        return f'<c r="{ref}" s="{STYLE_HEURE}"><v>{fraction!r}</v></c>'
+    texte = escape(CARACTERES_INTERDITS.sub("", str(valeur)))
+    return f'<c r="{ref}" t="inlineStr"{attr_style}><is><t xml:space="preserve">{texte}</t></is></c>'
+
+
+def ecrire_xlsx_direct(df: pd.DataFrame, path: Path, sheet_name: str = "Sheet1") -> None:
+    """Écrit *df* dans *path* en produisant directement le XML de la feuille.
+
+    Les parties fixes du classeur (types, relations, styles) sont des gabarits ;
+    ``xl/worksheets/sheet1.xml`` est écrit en flux dans l'archive, par blocs de
+    ``TAILLE_BLOC`` lignes rendus colonne par colonne, sans openpyxl ni
+    xlsxwriter. Les colonnes de ``NUMERIC_COLUMNS_TO_FORMAT`` reçoivent le
+    style de leur format numérique ; les textes sont écrits en ligne
+    (« inlineStr »), sans table de chaînes partagées.
+    """
+    formats = list(dict.fromkeys(NUMERIC_COLUMNS_TO_FORMAT.values()))
+    style_format = {fmt: idx for idx, fmt in enumerate(formats, start=STYLE_HEURE + 1)}
+    styles = [style_format.get(NUMERIC_COLUMNS_TO_FORMAT.get(c), 0) for c in df.columns]
+    lettres = [lettre_colonne(idx) for idx in range(1, len(df.columns) + 1)]
+
+    # Accès par position : les noms de colonnes peuvent être en double
+    largeurs = []
+    for col_name, serie in df.items():
+        if col_name in NUMERIC_COLUMNS_TO_FORMAT:
+            serie = serie.round(2)  # largeur de la valeur affichée, pas stockée
+        largeurs.append(largeur_colonne(serie))
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", XML_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", XML_RELS)
+        zf.writestr("xl/workbook.xml", XML_WORKBOOK.format(nom=escape(sheet_name, {'"': "&quot;"})))
+        zf.writestr("xl/_rels/workbook.xml.rels", XML_WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", xml_styles(formats))
+
+        with zf.open("xl/worksheets/sheet1.xml", "w") as flux:
+            derniere = f"{lettres[-1]}{len(df) + 1}" if lettres else "A1"
+            cols = "".join(
+                f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+                for i, w in enumerate(largeurs, start=1)
+            )
+            entete = "".join(
+                valeur_xml(col_name, f"{lettre}1", f' s="{STYLE_ENTETE}"')
+                for lettre, col_name in zip(lettres, df.columns)
+            )
+            flux.write(
+                f'{XML_DECLARATION}<worksheet xmlns="{NS_MAIN}"><dimension ref="A1:{derniere}"/>'
+                f'{f"<cols>{cols}</cols>" if cols else ""}<sheetData><row r="1">{entete}</row>'.encode()
+            )
+
+            for debut in range(0, len(df), TAILLE_BLOC):
+                bloc = df.iloc[debut:debut + TAILLE_BLOC]
+                premiere = debut + 2  # ligne 1 = en‑tête
+                colonnes = [
+                    cellules_xml(bloc.iloc[:, idx], lettre, premiere, style)
+                    for idx, (lettre, style) in enumerate(zip(lettres, styles))
+                ]
+                flux.write(
+                    "".join(
+                        f'<row r="{r}">{"".join(cellules)}</row>'
+                        for r, cellules in enumerate(zip(*colonnes), start=premiere)
+                    ).encode()
+                )
+            flux.write(b"</sheetData></worksheet>")
+
+
+@cache
+def noyau_numba() -> Callable[..., None] | None:
+    """Compile (une fois par exécution) le noyau Numba, ou ``None`` sans Numba.
+
+    Numba n'est importé qu'ici : son import (~0,25 s) n'est payé que par les
+    feuilles dépassant ``SEUIL_NUMBA`` lignes. Le code compilé est mis en
+    cache sur disque (``cache=True``).
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    # fastmath sans « nnan » ni « ninf » : les valeurs manquantes (NaN)
+    # doivent se propager comme avec NumPy ; sans « arcp » non plus, pour que
+    # la division de l'arrondi reste exacte (identique à np.round).
+    @njit(parallel=True, fastmath={"nsz", "contract", "afn"}, cache=True)
+    def calculer_poids_numba(vi, vf, pe, ps, pw, out_vol, out_eau, out_net_c, out_net_r):
+        """Calcule les quatre colonnes dérivées en une seule passe parallèle."""
+        for i in prange(vi.shape[0]):
+            vol = np.rint((vf[i] - vi[i]) * 100.0) / 100.0  # = np.round(…, 2)
+            eau = np.rint(vol * WATER_COEF * 100.0) / 100.0
+            diff = ps[i] - pe[i]
+            out_vol[i] = vol
+            out_eau[i] = eau
+            out_net_c[i] = (diff - pw[i]) * DRY_COEF
+            out_net_r[i] = (diff - eau) * DRY_COEF
+
+    return calculer_poids_numba
+
+
+def calculer_poids(
+    vi: np.ndarray, vf: np.ndarray, pe: np.ndarray, ps: np.ndarray, pw: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calcule volume chargé, poids eau, poids net calculé et poids net recalculé.
+
+    Au‑delà de ``SEUIL_NUMBA`` lignes, un noyau Numba fusionné calcule tout
+    en une passe si Numba est installé. Sinon les expressions sont évaluées
+    par NumPy en limitant les tableaux intermédiaires. Volume chargé et poids
+    eau sont arrondis à 2 décimales, comme à l'origine, car le poids net
+    recalculé en dépend ; les poids nets ne sont pas arrondis, l'affichage à
+    2 décimales est assuré par le format Excel.
+    """
+    noyau = noyau_numba() if vi.shape[0] >= SEUIL_NUMBA else None
+    if noyau is not None:
+        vol, eau_calc, net_calc, net_recalc = (np.empty(vi.shape[0]) for _ in range(4))
+        noyau(vi, vf, pe, ps, pw, vol, eau_calc, net_calc, net_recalc)
+    else:
+        vol = np.round(np.subtract(vf, vi), 2)
+        eau_calc = np.multiply(vol, WATER_COEF)
+        np.round(eau_calc, 2, out=eau_calc)
+
+        diff = np.subtract(ps, pe)
+        net_calc = np.subtract(diff, pw)
+        net_calc *= DRY_COEF
+        # *diff* n'est plus utilisé ensuite, il sert donc de tampon de sortie
+        net_recalc = np.subtract(diff, eau_calc, out=diff)
+        net_recalc *= DRY_COEF
+
+    return vol, eau_calc, net_calc, net_recalc
 
 
 def ouvrir_fichier(chemin_fichier: Path) -> None:
     """Ouvre le fichier dans l'application associée (Windows, macOS, Linux)."""
+    import subprocess
+
     try:
         if sys.platform.startswith("win"):
             os.startfile(chemin_fichier)  # type: ignore[attr-defined]
@@ -136,70 +452,130 @@ def ouvrir_fichier(chemin_fichier: Path) -> None:
 # Cœur de l'analyse
 # ---------------------------------------------------------------------------
 
-def analyser_dechargement(fichier_excel: Path, dossier_sortie: Path) -> Path:
+def analyser_dechargement(
+    fichier_excel: Path, dossier_sortie: Path, excel: bool = True, verbose: bool = False
+) -> Path:
     """Lit *fichier_excel*, calcule les nouvelles métriques et sauvegarde le résultat.
 
+    Un fichier Parquet (``…_resultats.parquet``) est écrit à côté du résultat
+    Excel lorsque pyarrow est installé, pour une relecture rapide par les
+    traitements en aval.
+
     Parameters
     ----------
     fichier_excel : Path
         Le chemin du fichier source.
     dossier_sortie : Path
         Dossier dans lequel enregistrer le fichier résultat.
+    excel : bool
+        Si ``False``, seul le fichier Parquet est produit.
+    verbose : bool
+        Affiche un aperçu des colonnes utilisées et calculées.
 
     Returns
     -------
     Path
-        Chemin du fichier résultat créé.
+        Chemin du fichier résultat créé (Excel, ou Parquet si *excel* est faux).
     """
+    if not excel and pyarrow is None:
+        raise RuntimeError("pyarrow est requis pour l'export Parquet (--no-excel)")
+
     # ---------------------------------------------------------------------
     # 1) Lecture du fichier d'origine
     # ---------------------------------------------------------------------
     parse_cols = [COL_DEBUT_PESEE, COL_FIN_PESEE, COL_DEBUT_DECH, COL_FIN_DECH]
     df = pd.read_excel(
         fichier_excel,
+        engine=MOTEUR_LECTURE,
         parse_dates=parse_cols,
-        dtype="object",  # on laisse pandas déterminer les types ensuite
     )
 
     # Nettoyage des en‑têtes (espaces superflus)
     df.columns = df.columns.str.strip()
 
-    print("📊 Aperçu du tableau Excel importé :")
-    print(df.head())
+    # Conversion unique des colonnes de mesure en float64 : les calculs
+    # s'exécutent ensuite en NumPy natif plutôt que cellule par cellule.
+    df[COLONNES_NUMERIQUES] = df[COLONNES_NUMERIQUES].apply(pd.to_numeric, errors="coerce").astype("float64")
+    # parse_dates laisse en « object » les colonnes vides ou non reconnues ;
+    # le calcul des durées (.dt) exige un vrai datetime64.
+    for col in parse_cols:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    # Texte homogène stocké en Arrow plutôt qu'en objets Python ; les colonnes
+    # mixtes (ex. N° Dossier mêlant texte et nombres) gardent leurs types.
+    if pyarrow is not None:
+        for idx, (_, serie) in enumerate(df.items()):
+            if serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) == "string":
+                df.isetitem(idx, serie.astype("string[pyarrow]"))
+
+    if verbose:
+        print("📊 Aperçu du tableau Excel importé :")
+        print(df.head()[[c for c in COLONNES_MODELE if c in df.columns]])
 
     # ---------------------------------------------------------------------
     # 2) Calculs
     # ---------------------------------------------------------------------
-    df[COL_VOL_CHARGE_CALCULE] = round(df[COL_VOL_FINAL] - df[COL_VOL_INIT], 2)
-    df[COL_POIDS_EAU_CALCULE] = round(df[COL_VOL_CHARGE_CALCULE] * (1 + 6.6 / 100), 2)
-
-    df[COL_DUREE_OPERATION] = df[COL_FIN_DECH] - df[COL_DEBUT_DECH]
-    df[COL_TEMPS_TR] = df[COL_FIN_PESEE] - df[COL_DEBUT_PESEE]
-
-    # Poids net calculé (utilise la mesure de l'eau si disponible)
-    df[COL_POIDS_NET_CALCULE] = round(
-        (df[COL_POIDS_SORTIE] - df[COL_POIDS_ENTREE] - df[COL_POIDS_EAU]) * (1 - 7 / 100), 2
+    vol, eau_calc, net_calc, net_recalc = calculer_poids(
+        df[COL_VOL_INIT].to_numpy(np.float64),
+        df[COL_VOL_FINAL].to_numpy(np.float64),
+        df[COL_POIDS_ENTREE].to_numpy(np.float64),
+        df[COL_POIDS_SORTIE].to_numpy(np.float64),
+        df[COL_POIDS_EAU].to_numpy(np.float64),
     )
 
-
-    # Poids net recalculé (utilise le poids eau recalculé)
-    df[COL_POIDS_NET_RECALCULE] = round(
-        (df[COL_POIDS_SORTIE] - df[COL_POIDS_ENTREE] - df[COL_POIDS_EAU_CALCULE]) * (1 - 7 / 100), 2
+    # Durées converties en heures (float64) plutôt qu'en timedelta
+    duree = (df[COL_FIN_DECH] - df[COL_DEBUT_DECH]).dt.total_seconds() / 3600.0
+    temps = (df[COL_FIN_PESEE] - df[COL_DEBUT_PESEE]).dt.total_seconds() / 3600.0
+
+    # Toutes les colonnes calculées sont ajoutées en une fois (une seule
+    # reconstruction du DataFrame au lieu d'une par colonne)
+    df = df.assign(
+        **{
+            COL_VOL_CHARGE_CALCULE: vol,
+            COL_POIDS_EAU_CALCULE: eau_calc,
+            COL_DUREE_OPERATION: duree,
+            COL_TEMPS_TR: temps,
+            # Poids net calculé (utilise la mesure de l'eau si disponible)
+            COL_POIDS_NET_CALCULE: net_calc,
+            # Poids net recalculé (utilise le poids eau recalculé)
+            COL_POIDS_NET_RECALCULE: net_recalc,
+        }
     )
-    print("📊 Tableau final avec colonnes calculées :")
-    print(df.head(10))
+    if verbose:
+        print("📊 Tableau final avec colonnes calculées :")
+        print(df.head(10)[list(COLONNES_CALCULEES)])
 
     # ---------------------------------------------------------------------
     # 3) Export du résultat ( Sauvegarde)
     # ---------------------------------------------------------------------
     dossier_sortie.mkdir(parents=True, exist_ok=True)
     fichier_resultat = dossier_sortie / f"{fichier_excel.stem}_resultats.xlsx"
-    df.to_excel(fichier_resultat, index=False)
-    appliquer_format_numerique(fichier_resultat)
-    ajuster_largeur_colonnes(fichier_resultat)
 
-    print(f"✔︎ Résultat enregistré : {fichier_resultat.relative_to(Path.cwd()) if fichier_resultat.is_relative_to(Path.cwd()) else fichier_resultat}")
-    return fichier_resultat
+    if excel:
+        ecrire_xlsx_direct(df, fichier_resultat)
+        print(f"✔︎ Résultat enregistré : {fichier_resultat.relative_to(Path.cwd()) if fichier_resultat.is_relative_to(Path.cwd()) else fichier_resultat}")
+
+    # Copie Parquet facultative : un échec (colonnes mixtes, noms en double…)
+    # ne doit pas priver l'utilisateur du résultat Excel déjà écrit.
+    fichier_parquet = fichier_resultat.with_suffix(".parquet")
+    if pyarrow is not None:
+        # Parquet exige un type par colonne : les colonnes mixtes (ex. N° Dossier
+        # mêlant texte et nombres), conservées telles quelles pour Excel, sont
+        # écrites en texte dans cette copie seulement.
+        df_parquet = df.copy(deep=False)
+        for idx, (_, serie) in enumerate(df.items()):
+            if serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) in ("mixed", "mixed-integer"):
+                df_parquet.isetitem(idx, serie.astype("string[pyarrow]"))
+        try:
+            df_parquet.to_parquet(fichier_parquet, engine="pyarrow", compression="zstd", index=False)
+        except Exception as exc:
+            if not excel:
+                raise
+            print(f"⚠️ Copie Parquet non enregistrée : {exc}")
+        else:
+            print(f"✔︎ Parquet enregistré : {fichier_parquet.relative_to(Path.cwd()) if fichier_parquet.is_relative_to(Path.cwd()) else fichier_parquet}")
+
+    return fichier_resultat if excel else fichier_parquet
 
 
 # ---------------------------------------------------------------------------
@@ -208,6 +584,10 @@ def analyser_dechargement(fichier_excel: Path, dossier_sortie: Path) -> Path:
 
 def cli_selectionner_fichier() -> Path | None:
     """Ouvre une fenêtre de sélection de fichier et renvoie le chemin choisi."""
+    # Import local : Tk n'est initialisé que si la boîte de dialogue est utilisée
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
     dossier_defaut = Path.cwd() / "Excel"
@@ -233,6 +613,17 @@ def creer_fichier_modele(dossier_excel: Path) -> None:
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Analyse de déchargement de navires")
     parser.add_argument("--input", "-i", type=Path, help="Chemin du fichier Excel à traiter")
+    parser.add_argument(
+        "--no-excel",
+        action="store_true",
+        help="N'écrit que le fichier Parquet, sans le résultat Excel",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Affiche un aperçu des données importées et calculées",
+    )
     args = parser.parse_args(argv)
 
     dossier_excel = Path.cwd() / "Excel"
@@ -259,8 +650,11 @@ def main(argv: list[str] | None = None) -> None:
     dossier_sortie = Path.cwd() / "Data_Analysis" / date.today().isoformat()
 
     try:
-        fichier_resultat = analyser_dechargement(fichier_source, dossier_sortie)
-        ouvrir_fichier(fichier_resultat)
+        fichier_resultat = analyser_dechargement(
+            fichier_source, dossier_sortie, excel=not args.no_excel, verbose=args.verbose
+        )
+        if not args.no_excel:
+            ouvrir_fichier(fichier_resultat)
     except Exception as exc:
         print(f"⚠️ Erreur lors du traitement : {exc}")
 
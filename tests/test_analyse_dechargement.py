@@ -0,0 +1,64 @@
+"""Traitement complet de ``analyser_dechargement``."""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyse_dechargement as ad  # noqa: E402
+
+
+def fichier_source(dossier: Path) -> Path:
+    """Écrit un petit fichier source dont « N° Dossier » mêle texte et nombres."""
+    debut = pd.Timestamp("2024-01-01 08:00")
+    df = pd.DataFrame({
+        "N° Dossier": ["D1", 5, "D3"],
+        ad.COL_DEBUT_PESEE: [debut] * 3,
+        ad.COL_FIN_PESEE: [debut + pd.Timedelta(hours=2)] * 3,
+        ad.COL_DEBUT_DECH: [debut] * 3,
+        ad.COL_FIN_DECH: [debut + pd.Timedelta(minutes=90)] * 3,
+        ad.COL_VOL_INIT: [10.0, 20.0, 30.0],
+        ad.COL_VOL_FINAL: [110.0, 220.0, 330.0],
+        ad.COL_POIDS_ENTREE: [1000.0, 2000.0, 3000.0],
+        ad.COL_POIDS_SORTIE: [5000.0, 6000.0, 7000.0],
+        ad.COL_POIDS_EAU: [100.0, 200.0, 300.0],
+    })
+    chemin = dossier / "source.xlsx"
+    df.to_excel(chemin, index=False)
+    return chemin
+
+
+@unittest.skipIf(ad.pyarrow is None, "pyarrow absent")
+class TestExportParquet(unittest.TestCase):
+    def analyser(self, excel: bool) -> tuple[Path, Path]:
+        dossier = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        source = fichier_source(dossier)
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultat = ad.analyser_dechargement(source, dossier / "sortie", excel=excel)
+        return dossier / "sortie", resultat
+
+    def test_parquet_seul(self):
+        sortie, resultat = self.analyser(excel=False)
+        self.assertEqual(resultat.suffix, ".parquet")
+        self.assertFalse(any(sortie.glob("*.xlsx")))
+        df = pd.read_parquet(resultat)
+        self.assertEqual(df["N° Dossier"].tolist(), ["D1", "5", "D3"])
+        self.assertEqual(df[ad.COL_VOL_CHARGE_CALCULE].tolist(), [100.0, 200.0, 300.0])
+        self.assertEqual(df[ad.COL_DUREE_OPERATION].tolist(), [1.5, 1.5, 1.5])
+
+    def test_excel_et_parquet(self):
+        sortie, resultat = self.analyser(excel=True)
+        self.assertEqual(resultat.suffix, ".xlsx")
+        self.assertTrue(resultat.with_suffix(".parquet").exists())
+        # Le résultat Excel garde les types d'origine de la colonne mixte
+        self.assertEqual(pd.read_excel(resultat)["N° Dossier"].tolist(), ["D1", 5, "D3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
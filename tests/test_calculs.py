@@ -0,0 +1,52 @@
+"""Calculs de ``calculer_poids``."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyse_dechargement as ad  # noqa: E402
+
+
+def mesures(n: int = 1000, graine: int = 0) -> tuple[np.ndarray, ...]:
+    """Mesures aléatoires (vi, vf, pe, ps, pw) avec quelques valeurs manquantes."""
+    rng = np.random.default_rng(graine)
+    vi = rng.uniform(0, 500, n).round(3)
+    vf = vi + rng.uniform(0, 30_000, n).round(3)
+    pe = rng.uniform(10_000, 30_000, n).round(1)
+    ps = pe + rng.uniform(1_000, 40_000, n).round(1)
+    pw = rng.uniform(0, 30_000, n).round(1)
+    vi[5] = np.nan
+    pw[7] = np.nan
+    return vi, vf, pe, ps, pw
+
+
+class TestCalculerPoids(unittest.TestCase):
+    def test_arrondis_comme_a_l_origine(self):
+        vi, vf, pe, ps, pw = mesures()
+        vol, eau_calc, net_calc, net_recalc = ad.calculer_poids(vi, vf, pe, ps, pw)
+        vol_attendu = np.round(vf - vi, 2)
+        eau_attendue = np.round(vol_attendu * ad.WATER_COEF, 2)
+        np.testing.assert_array_equal(vol, vol_attendu)
+        np.testing.assert_array_equal(eau_calc, eau_attendue)
+        np.testing.assert_array_equal(net_calc, (ps - pe - pw) * ad.DRY_COEF)
+        np.testing.assert_array_equal(net_recalc, (ps - pe - eau_attendue) * ad.DRY_COEF)
+
+
+    @unittest.skipIf(ad.noyau_numba() is None, "numba absent")
+    def test_noyau_numba_identique_a_numpy(self):
+        donnees = mesures()
+        with mock.patch.object(ad, "SEUIL_NUMBA", len(donnees[0]) + 1):
+            attendu = ad.calculer_poids(*donnees)
+        with mock.patch.object(ad, "SEUIL_NUMBA", 0):
+            obtenu = ad.calculer_poids(*donnees)
+        for a, b in zip(attendu, obtenu):
+            np.testing.assert_array_equal(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
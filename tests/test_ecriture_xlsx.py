@@ -0,0 +1,99 @@
+"""Aller-retour de ``ecrire_xlsx_direct`` contre ``pd.read_excel``."""
+
+import sys
+import tempfile
+import unittest
+from datetime import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyse_dechargement as ad  # noqa: E402
+
+
+def ecrire_et_relire(df: pd.DataFrame, engine: str = "openpyxl") -> pd.DataFrame:
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = Path(dossier) / "resultat.xlsx"
+        ad.ecrire_xlsx_direct(df, chemin)
+        return pd.read_excel(chemin, engine=engine)
+
+
+class TestEcritureXlsx(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "Texte": ["a <b> & \"c\"", "  espaces  ", None],
+            ad.COL_VOL_CHARGE_CALCULE: [1.5, np.nan, 1234.25],
+            "Entier": [1, 2, 3],
+            "Booléen": [True, False, True],
+            "Date": pd.to_datetime(["2024-01-02 03:04:05", None, "1999-12-31 00:00:00"]),
+            "Durée": pd.to_timedelta(["1h", "90min", None]),
+            "Mixte": ["D0", 1, pd.Timestamp("2024-05-06")],
+            "Heure": [time(8, 30), time(23, 59, 59), None],
+        })
+
+    def test_aller_retour(self):
+        relu = ecrire_et_relire(self.df)
+        self.assertEqual(list(relu.columns), list(self.df.columns))
+        self.assertEqual(relu["Texte"].iloc[0], "a <b> & \"c\"")
+        self.assertEqual(relu["Texte"].iloc[1], "  espaces  ")
+        self.assertTrue(pd.isna(relu["Texte"].iloc[2]))
+        pd.testing.assert_series_equal(relu[ad.COL_VOL_CHARGE_CALCULE], self.df[ad.COL_VOL_CHARGE_CALCULE])
+        self.assertEqual(relu["Entier"].tolist(), [1, 2, 3])
+        self.assertEqual(relu["Entier"].dtype, np.int64)
+        self.assertEqual(relu["Booléen"].tolist(), [True, False, True])
+        pd.testing.assert_series_equal(relu["Date"], self.df["Date"], check_dtype=False)
+        self.assertEqual(relu["Mixte"].iloc[0], "D0")
+        self.assertIsInstance(relu["Mixte"].iloc[1], int)
+        self.assertEqual(relu["Mixte"].iloc[1], 1)
+        self.assertEqual(relu["Heure"].iloc[:2].tolist(), [time(8, 30), time(23, 59, 59)])
+        self.assertTrue(pd.isna(relu["Heure"].iloc[2]))
+
+    def test_durees_en_jours(self):
+        relu = ecrire_et_relire(self.df)
+        duree = pd.to_timedelta(relu["Durée"].tolist())
+        self.assertEqual(duree[0], pd.Timedelta("1h"))
+        self.assertEqual(duree[1], pd.Timedelta("90min"))
+        self.assertTrue(pd.isna(duree[2]))
+
+    def test_styles(self):
+        from openpyxl import load_workbook
+
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = Path(dossier) / "resultat.xlsx"
+            ad.ecrire_xlsx_direct(self.df, chemin)
+            feuille = load_workbook(chemin).active
+            self.assertTrue(feuille["A1"].font.bold)
+            self.assertEqual(feuille["B2"].number_format,
+                             ad.NUMERIC_COLUMNS_TO_FORMAT[ad.COL_VOL_CHARGE_CALCULE])
+            self.assertEqual(feuille["E2"].number_format, ad.FORMAT_DATE)
+            self.assertEqual(feuille["F2"].number_format, ad.FORMAT_DUREE)
+            self.assertEqual(feuille["H2"].number_format, ad.FORMAT_HEURE)
+            self.assertIsNone(feuille["B3"].value)
+
+    def test_lettre_colonne(self):
+        attendu = {1: "A", 26: "Z", 27: "AA", 52: "AZ", 702: "ZZ", 703: "AAA", 16384: "XFD"}
+        for numero, lettres in attendu.items():
+            self.assertEqual(ad.lettre_colonne(numero), lettres)
+
+    def test_largeur_dates_a_minuit(self):
+        serie = pd.Series(pd.to_datetime(["2024-01-01", "2024-02-01"]), name="Date")
+        self.assertEqual(ad.largeur_colonne(serie), ad.LARGEUR_DATE + 2)
+
+    def test_noms_en_double(self):
+        df = pd.DataFrame([["x", "y"], ["z", "t"]], columns=["Navire", "Navire"])
+        relu = ecrire_et_relire(df)
+        self.assertEqual(relu.iloc[:, 0].tolist(), ["x", "z"])
+        self.assertEqual(relu.iloc[:, 1].tolist(), ["y", "t"])
+
+    @unittest.skipIf(ad.MOTEUR_LECTURE != "calamine", "python-calamine absent")
+    def test_lecture_calamine(self):
+        relu = ecrire_et_relire(self.df, engine="calamine")
+        self.assertEqual(relu["Texte"].iloc[0], "a <b> & \"c\"")
+        self.assertEqual(relu["Entier"].tolist(), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()